@@ -19,10 +19,34 @@ Usage (import):
 """
 
 import argparse
+import functools
 import hashlib
+import math
+import os
 import random
+import re
+import struct
+from operator import itemgetter
 import geohash
 
+__all__ = [
+    'MyArgumentParser', 'parse_coords', 'key_shuffle', 'get_words',
+    'GOOGLE_WORDLIST', 'GOOGLE_4096WORDS', 'WORDNET_LEMMAS', 'HUMAN_WORDLIST',
+    'WordHasher', 'set_key', 'three_words', 'three_words_many', 'four_words',
+    'six_words', 'decode', 'main',
+]
+
+try:
+    import pygeohash_fast
+except ImportError:
+    pygeohash_fast = None
+
+# "lat lon", "lat,lon" or "lat, lon", capturing both numbers.
+_NUMBER = r"[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?"
+_COORD_RE = re.compile(r"\s*(%s)(?:\s*,\s*|\s+)(%s)\s*" % (_NUMBER, _NUMBER))
+# A command-line token that is a coordinate pair or a single coordinate.
+_COORD_ARG_RE = re.compile(r"\s*%s(?:(?:\s*,\s*|\s+)%s)?\s*" % (_NUMBER, _NUMBER))
+
 # --- Custom ArgumentParser to treat coordinate strings as positional ---
 class MyArgumentParser(argparse.ArgumentParser):
     def _parse_optional(self, arg_string):
@@ -32,32 +56,9 @@ class MyArgumentParser(argparse.ArgumentParser):
          "-33.867480754852295 151.20700120925903"),
         then it is not treated as an optional argument.
         """
-        # Check for comma-separated coordinates
-        if ',' in arg_string:
-            tokens = arg_string.split(',')
-            if len(tokens) == 2:
-                try:
-                    float(tokens[0].strip())
-                    float(tokens[1].strip())
-                    return None
-                except ValueError:
-                    pass
-        # Check for space-separated coordinates
-        if ' ' in arg_string:
-            tokens = arg_string.split()
-            if len(tokens) == 2:
-                try:
-                    float(tokens[0].strip())
-                    float(tokens[1].strip())
-                    return None
-                except ValueError:
-                    pass
-        # Also, if the string is a single number (like "-33.867480754852295")
-        try:
-            float(arg_string)
+        # Coordinate pairs, or a single number (like "-33.867480754852295")
+        if _COORD_ARG_RE.fullmatch(arg_string) is not None:
             return None
-        except ValueError:
-            pass
         return super()._parse_optional(arg_string)
 
 # --- Utility: Parse coordinate strings ---
@@ -75,43 +76,138 @@ def parse_coords(coords):
         else:
             raise ValueError("Coordinates must contain exactly two values.")
     elif isinstance(coords, str):
-        coords = coords.strip()
-        if ',' in coords:
-            parts = coords.split(',')
-        else:
-            parts = coords.split()
-        parts = [p.strip() for p in parts if p.strip()]
-        if len(parts) != 2:
+        m = _COORD_RE.fullmatch(coords)
+        if m is None:
             raise ValueError("Coordinate string must contain exactly two numbers.")
-        return (float(parts[0]), float(parts[1]))
+        return (float(m[1]), float(m[2]))
     else:
         raise ValueError("Coordinates must be a string or a tuple of two numbers.")
 
+# --- Utility: Geohash backend ---
+def _geohash_decode(geo_hash):
+    """geohash.decode, using pygeohash_fast when it is installed."""
+    if pygeohash_fast is not None:
+        lon, lat, _, _ = pygeohash_fast.decode(geo_hash)
+        return (lat, lon)
+    return geohash.decode(geo_hash)
+
+# --- Utility: Coordinates to geohash bits ---
+def _spread_bits(x):
+    """Spread the low 32 bits of x out to the even bit positions."""
+    x = (x | (x << 16)) & 0x0000FFFF0000FFFF
+    x = (x | (x << 8)) & 0x00FF00FF00FF00FF
+    x = (x | (x << 4)) & 0x0F0F0F0F0F0F0F0F
+    x = (x | (x << 2)) & 0x3333333333333333
+    return (x | (x << 1)) & 0x5555555555555555
+
+# _spread_bits for every 12-bit value, so the hot path is two table lookups.
+_SPREAD_12 = tuple(_spread_bits(i) for i in range(1 << 12))
+
+def _geohash_u64(f):
+    """
+    Map f in (-2**-10, 2**-10) to 64 bits exactly as geohash's C/Rust
+    double_to_i64 does: the magnitude is truncated before it is negated,
+    the right shift wraps at 64 and subnormals map to the midpoint.
+    """
+    bits = struct.unpack('<Q', struct.pack('<d', f))[0]
+    exp = (bits >> 52) & 0x7FF
+    if exp == 0:
+        return 1 << 63
+    value = ((bits & 0xFFFFFFFFFFFFF) | (1 << 52)) >> ((0x3FF - 11 - exp) & 63)
+    return (1 << 63) - value if bits >> 63 else (1 << 63) + value
+
+def _latlon_to_bits45(lat, lon):
+    """
+    Return the 45-bit integer of the 9-character geohash of (lat, lon),
+    i.e. geo_to_int(geohash.encode(lat, lon, 9)) without building the string.
+    Longitude takes 23 bits and latitude 22, interleaved longitude first.
+    """
+    # geohash works in C doubles; NumPy float32 and friends would otherwise
+    # keep their own precision through the scaling below.
+    lat = float(lat)
+    lon = float(lon)
+    if not -90.0 <= lat <= 90.0:
+        raise ValueError("invalid latitude.")
+    if not -180.0 <= lon < 180.0:
+        if not math.isfinite(lon):
+            raise ValueError("invalid longitude.")
+        while lon < -180.0:
+            lon += 360.0
+        while lon >= 180.0:
+            lon -= 360.0
+    # Scaling by a power of two is exact, so floor() picks the same cell
+    # as geohash. Near zero geohash truncates towards the equator or
+    # meridian instead, so follow its rounding there. 90.0 falls in the
+    # northernmost cell.
+    lat = lat / 90.0
+    lon = lon / 180.0
+    if -0.0009765625 < lat < 0.0009765625:
+        lat_bits = _geohash_u64(lat) >> 42
+    else:
+        lat_bits = math.floor(math.ldexp(lat, 21)) + 0x200000
+        if lat_bits > 0x3FFFFF:
+            lat_bits = 0x3FFFFF
+    if -0.0009765625 < lon < 0.0009765625:
+        lon_bits = _geohash_u64(lon) >> 41
+    else:
+        lon_bits = math.floor(math.ldexp(lon, 22)) + 0x400000
+    spread = _SPREAD_12
+    return (spread[lon_bits & 0xFFF] | (spread[lon_bits >> 12] << 24)
+            | (spread[lat_bits & 0xFFF] << 1) | (spread[lat_bits >> 12] << 25))
+
 # --- Utility: Deterministic key-based shuffle ---
 def key_shuffle(word_list, key):
     """
     Deterministically shuffle a list of words using a secret key.
-    Each word is hashed with the key (using SHA256) and then sorted by that hash.
+    Each word is hashed with a BLAKE2b keyed PRF and then sorted by that hash.
     """
-    hashed = [(word, hashlib.sha256((key + word).encode('utf-8')).hexdigest())
-              for word in word_list]
-    sorted_words = [word for word, _ in sorted(hashed, key=lambda x: x[1])]
-    return sorted_words
+    key_bytes = key.encode('utf-8')
+    if len(key_bytes) > hashlib.blake2b.MAX_KEY_SIZE:
+        key_bytes = hashlib.blake2b(key_bytes).digest()
+    prf = hashlib.blake2b(key=key_bytes, digest_size=8)
+
+    def digest(word):
+        h = prf.copy()
+        h.update(word.encode('utf-8'))
+        return h.digest()
+
+    return sorted(word_list, key=digest)
 
 # --- Utility: Load word list from file ---
+@functools.lru_cache(maxsize=None)
+def _load_words(fname):
+    """Load and shuffle a word list once per process; see get_words."""
+    return get_words(fname)
+
 def get_words(fname):
     with open(fname, "r") as f:
         words = [line.strip() for line in f]
-    random.seed(634634)
-    random.shuffle(words)
+    random.Random(634634).shuffle(words)
     words = words[:2**15]
     assert len(words) == len(set(words))
     return words
 
-# --- Word lists ---
-GOOGLE_WORDLIST = get_words("words/google-ngram-list")
-GOOGLE_4096WORDS = get_words("words/google-ngram-list-4096")
-WORDNET_LEMMAS = get_words("words/wordnet-list")
+# --- Word lists (loaded lazily on first access) ---
+# Resolved now, so a later os.chdir() doesn't break the first load.
+_WORDS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "words")
+_WORDLIST_FILES = {
+    'GOOGLE_WORDLIST': os.path.join(_WORDS_DIR, "google-ngram-list"),
+    'GOOGLE_4096WORDS': os.path.join(_WORDS_DIR, "google-ngram-list-4096"),
+    'WORDNET_LEMMAS': os.path.join(_WORDS_DIR, "wordnet-list"),
+}
+
+def __getattr__(name):
+    """
+    Resolve GOOGLE_WORDLIST, GOOGLE_4096WORDS and WORDNET_LEMMAS on demand,
+    so only the word lists that are actually used get read and shuffled.
+    """
+    if name in _WORDLIST_FILES:
+        return _load_words(_WORDLIST_FILES[name])
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+def __dir__():
+    """List the lazily loaded word lists alongside the module's globals."""
+    return sorted(set(globals()) | set(_WORDLIST_FILES))
 
 HUMAN_WORDLIST = (
     'ack', 'alabama', 'alanine', 'alaska', 'alpha', 'angel', 'apart', 'april',
@@ -151,49 +247,101 @@ HUMAN_WORDLIST = (
     'wisconsin', 'wolfram', 'wyoming', 'xray', 'yankee', 'yellow', 'zebra',
     'zulu'
 )
+_HUMAN_INDEX = {w: i for i, w in enumerate(HUMAN_WORDLIST)}
+
+# --- Key-shuffled word lists, shared between WordHasher instances ---
+@functools.lru_cache(maxsize=64)
+def _shuffled(list_name, key):
+    """
+    Return the named word list (e.g. 'GOOGLE_WORDLIST' or 'HUMAN_WORDLIST')
+    shuffled with key, as a tuple. Repeated use of the same key is free.
+    """
+    if list_name == 'HUMAN_WORDLIST':
+        words = HUMAN_WORDLIST
+    else:
+        words = _load_words(_WORDLIST_FILES[list_name])
+    return tuple(key_shuffle(words, key))
 
 # --- WordHasher class ---
 class WordHasher(object):
+    _symbols = "0123456789bcdefghjkmnpqrstuvwxyz"
+    # Geohash symbols -> standard base-32 digits, and symbol values 0-31 -> symbols.
+    _to_std32 = str.maketrans(_symbols, "0123456789abcdefghijklmnopqrstuv")
+    _from_values = bytes.maketrans(bytes(range(32)), _symbols.encode('ascii'))
+
     def __init__(self, key=None):
         """
         Convert latitude and longitudes into human-readable word addresses.
         If a key is provided, the word lists are deterministically shuffled
         based on that key.
         """
-        self._symbols = "0123456789bcdefghjkmnpqrstuvwxyz"
-        self._decode_symbols = {ch: i for i, ch in enumerate(self._symbols)}
-        self._encode_symbols = {i: ch for i, ch in enumerate(self._symbols)}
-        self.six_wordlist = HUMAN_WORDLIST
-        self.four_wordlist = GOOGLE_4096WORDS
-        self.three_wordlist = GOOGLE_WORDLIST
-
-        if key:
-            self.three_wordlist = key_shuffle(self.three_wordlist, key)
-            self.four_wordlist = key_shuffle(self.four_wordlist, key)
-            self.six_wordlist = key_shuffle(self.six_wordlist, key)
+        self.key = key
+
+    # Each list is loaded (and shuffled, if keyed) on first use only.
+    @functools.cached_property
+    def three_wordlist(self):
+        if self.key:
+            return _shuffled('GOOGLE_WORDLIST', self.key)
+        return _load_words(_WORDLIST_FILES['GOOGLE_WORDLIST'])
+
+    @functools.cached_property
+    def four_wordlist(self):
+        if self.key:
+            return _shuffled('GOOGLE_4096WORDS', self.key)
+        return _load_words(_WORDLIST_FILES['GOOGLE_4096WORDS'])
+
+    @functools.cached_property
+    def six_wordlist(self):
+        if self.key:
+            return _shuffled('HUMAN_WORDLIST', self.key)
+        return HUMAN_WORDLIST
+
+    @functools.cached_property
+    def _three_index(self):
+        return {w: i for i, w in enumerate(self.three_wordlist)}
+
+    @functools.cached_property
+    def _four_index(self):
+        return {w: i for i, w in enumerate(self.four_wordlist)}
+
+    @functools.cached_property
+    def _six_index(self):
+        if self.six_wordlist is HUMAN_WORDLIST:
+            return _HUMAN_INDEX
+        return {w: i for i, w in enumerate(self.six_wordlist)}
 
     def three_words(self, lat_long):
         """Convert coordinates to a three-word address."""
         lat, lon = parse_coords(lat_long) if isinstance(lat_long, str) else lat_long
-        gh = geohash.encode(lat, lon, 9)
-        indices = self.to_rugbits(self.geo_to_int(gh))
-        words = "-".join(self.three_wordlist[p] for p in indices)
+        indices = self.to_rugbits(_latlon_to_bits45(lat, lon))
+        words = "-".join(itemgetter(*indices)(self.three_wordlist))
         return words
 
+    def three_words_many(self, lats, lons):
+        """
+        Convert two sequences of latitudes and longitudes, of the same length,
+        to three-word addresses. Returns a list of strings.
+        """
+        if len(lats) != len(lons):
+            raise ValueError("lats and lons must have the same length.")
+        to_bits = _latlon_to_bits45
+        to_rugbits = self.to_rugbits
+        wordlist = self.three_wordlist
+        return ["-".join(itemgetter(*to_rugbits(to_bits(lat, lon)))(wordlist))
+                for lat, lon in zip(lats, lons)]
+
     def four_words(self, lat_long):
         """Convert coordinates to a four-word address."""
         lat, lon = parse_coords(lat_long) if isinstance(lat_long, str) else lat_long
-        gh = geohash.encode(lat, lon, 9)
-        indices = self.to_quads(self.pad(gh))
-        words = "-".join(self.four_wordlist[p] for p in indices)
+        indices = self.to_quads(_latlon_to_bits45(lat, lon) << 3)
+        words = "-".join(itemgetter(*indices)(self.four_wordlist))
         return words
 
     def six_words(self, lat_long):
         """Convert coordinates to a six-word address."""
         lat, lon = parse_coords(lat_long) if isinstance(lat_long, str) else lat_long
-        gh = geohash.encode(lat, lon, 9)
-        indices = self.to_bytes(self.pad(gh))
-        words = "-".join(self.six_wordlist[p] for p in indices)
+        indices = self.to_bytes(_latlon_to_bits45(lat, lon) << 3)
+        words = "-".join(itemgetter(*indices)(self.six_wordlist))
         return words
 
     def decode(self, words):
@@ -203,80 +351,76 @@ class WordHasher(object):
         """
         words = words.replace('.', '-').split("-")
         if len(words) == 3:
-            i = self.rugbits_to_int([self.three_wordlist.index(w) for w in words])
+            i = self.rugbits_to_int(self._lookup(self._three_index, words))
         elif len(words) == 4:
-            i = self.quads_to_int([self.four_wordlist.index(w) for w in words])
+            i = self.quads_to_int(self._lookup(self._four_index, words))
             i = self.unpad(i)
         elif len(words) == 6:
-            i = self.bytes_to_int([self.six_wordlist.index(w) for w in words])
+            i = self.bytes_to_int(self._lookup(self._six_index, words))
             i = self.unpad(i)
         else:
             raise RuntimeError("Cannot decode a set of %i words." % len(words))
         geo_hash = self.int_to_geo(i)
-        return geohash.decode(geo_hash)
+        return _geohash_decode(geo_hash)
+
+    def _lookup(self, index, words):
+        try:
+            return [index[w] for w in words]
+        except KeyError as e:
+            raise ValueError("%r is not in the word list." % e.args[0]) from None
 
     def geo_to_int(self, geo_hash):
-        base = len(self._symbols)
-        number = 0
-        for symbol in geo_hash:
-            number = number * base + self._decode_symbols[symbol]
-        return number
+        # int() would also take 'a', 'i', 'l', 'o', '_' and whitespace, so
+        # reject anything outside the geohash alphabet first.
+        if geo_hash.strip(self._symbols):
+            raise ValueError("Invalid geohash %r." % geo_hash)
+        # The geohash alphabet is a permutation of base-32 digits, so map it
+        # onto the standard digits and let int() do the conversion.
+        return int(geo_hash.translate(self._to_std32), 32)
 
     def int_to_geo(self, integer):
-        base = len(self._symbols)
-        symbols = []
-        while integer > 0:
-            remainder = integer % base
-            integer //= base
-            symbols.append(self._encode_symbols[remainder])
-        return ''.join(reversed(symbols))
+        values = bytes((
+            (integer >> 40) & 0x1F, (integer >> 35) & 0x1F, (integer >> 30) & 0x1F,
+            (integer >> 25) & 0x1F, (integer >> 20) & 0x1F, (integer >> 15) & 0x1F,
+            (integer >> 10) & 0x1F, (integer >> 5) & 0x1F, integer & 0x1F
+        ))
+        return values.translate(self._from_values).decode('ascii')
 
     def pad(self, geo_hash):
         assert len(geo_hash) == 9
-        return self.geo_to_int(geo_hash) * 8
+        return self.geo_to_int(geo_hash) << 3
 
     def unpad(self, integer):
         return integer >> 3
 
     def to_bytes(self, integer):
-        bytes_list = [integer & 0xFF]
-        for n in range(1, 6):
-            div = 2 ** (n * 8)
-            bytes_list.append((integer // div) & 0xFF)
-        bytes_list.reverse()
-        return bytes_list
+        return tuple(integer.to_bytes(6, 'big'))
 
     def bytes_to_int(self, bytes_list):
         assert len(bytes_list) == 6
-        N = 0
-        bytes_list = list(reversed(bytes_list))
-        for n, b in enumerate(bytes_list):
-            N += b * (2 ** (8 * n))
-        return N
+        return int.from_bytes(bytes(bytes_list), 'big')
 
     def to_quads(self, integer):
-        quads = [integer & 0xFFF]
-        for n in range(1, 4):
-            div = 2 ** (n * 12)
-            quads.append((integer // div) & 0xFFF)
-        quads.reverse()
-        return quads
+        b = integer.to_bytes(6, 'big')
+        return (
+            (b[0] << 4) | (b[1] >> 4),
+            ((b[1] & 0xF) << 8) | b[2],
+            (b[3] << 4) | (b[4] >> 4),
+            ((b[4] & 0xF) << 8) | b[5]
+        )
 
     def quads_to_int(self, quads):
         assert len(quads) == 4
-        N = 0
-        quads = list(reversed(quads))
-        for n, b in enumerate(quads):
-            N += b * (2 ** (12 * n))
-        return N
+        q0, q1, q2, q3 = quads
+        return (q0 << 36) | (q1 << 24) | (q2 << 12) | q3
 
     def to_rugbits(self, integer):
         fifteen_bits = 0x7FFF
-        rugbits = [
+        rugbits = (
             (integer >> 30) & fifteen_bits,
             (integer >> 15) & fifteen_bits,
             integer & fifteen_bits
-        ]
+        )
         return rugbits
 
     def rugbits_to_int(self, rugbits):
@@ -286,13 +430,18 @@ class WordHasher(object):
 # --- Global default instance ---
 _default_hasher = WordHasher()
 
+@functools.lru_cache(maxsize=16)
+def _hasher_for(key):
+    """Return a shared WordHasher for key, used by the top-level functions."""
+    return WordHasher(key=key)
+
 def set_key(key):
     """
     Set the default secret key for encoding/decoding.
     Subsequent calls to the top-level functions will use this key.
     """
     global _default_hasher
-    _default_hasher = WordHasher(key=key)
+    _default_hasher = _hasher_for(key)
 
 # --- Top-level API functions ---
 def three_words(coords, key=None):
@@ -300,17 +449,25 @@ def three_words(coords, key=None):
     Convert coordinates (in any supported format) to a three-word address.
     """
     if key is not None:
-        return WordHasher(key=key).three_words(coords)
+        return _hasher_for(key).three_words(coords)
     return _default_hasher.three_words(coords)
 
+def three_words_many(lats, lons, key=None):
+    """
+    Convert sequences of latitudes and longitudes to three-word addresses.
+    """
+    if key is not None:
+        return _hasher_for(key).three_words_many(lats, lons)
+    return _default_hasher.three_words_many(lats, lons)
+
 def four_words(coords, key=None):
     if key is not None:
-        return WordHasher(key=key).four_words(coords)
+        return _hasher_for(key).four_words(coords)
     return _default_hasher.four_words(coords)
 
 def six_words(coords, key=None):
     if key is not None:
-        return WordHasher(key=key).six_words(coords)
+        return _hasher_for(key).six_words(coords)
     return _default_hasher.six_words(coords)
 
 def decode(words, key=None):
@@ -318,7 +475,7 @@ def decode(words, key=None):
     Decode a word address back to (latitude, longitude).
     """
     if key is not None:
-        return WordHasher(key=key).decode(words)
+        return _hasher_for(key).decode(words)
     return _default_hasher.decode(words)
 
 # --- Command-line interface ---
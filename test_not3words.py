@@ -0,0 +1,89 @@
+import math
+import random
+import unittest
+
+import geohash
+
+import not3words
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def geohash_bits45(lat, lon):
+    return not3words.WordHasher().geo_to_int(geohash.encode(lat, lon, 9))
+
+
+class LatLonToBits45Test(unittest.TestCase):
+    """_latlon_to_bits45 must pick the same cell as geohash.encode."""
+
+    def assertMatchesGeohash(self, points):
+        for lat, lon in points:
+            self.assertEqual(not3words._latlon_to_bits45(lat, lon),
+                             geohash_bits45(lat, lon), (lat, lon))
+
+    def test_random_points(self):
+        rng = random.Random(1)
+        self.assertMatchesGeohash(
+            (rng.uniform(-90, 90), rng.uniform(-180, 180)) for _ in range(5000))
+
+    def test_cell_boundaries(self):
+        rng = random.Random(2)
+        points = []
+        for _ in range(2000):
+            b = rng.randrange(1 << 22) * 180 / 2**22 - 90
+            for lat in (math.nextafter(b, -90), b, math.nextafter(b, 90)):
+                points.append((lat, rng.uniform(-180, 180)))
+            b = rng.randrange(1 << 23) * 360 / 2**23 - 180
+            for lon in (math.nextafter(b, -180), b, math.nextafter(b, 180)):
+                points.append((rng.uniform(-90, 90), lon))
+        self.assertMatchesGeohash(points)
+
+    def test_near_zero(self):
+        points = [(-0.009098052978515627, -100.8328628540039), (-2.37e-322, 0.0),
+                  (0.0, -0.0), (-0.0, 5e-324)]
+        for e in range(-1080, -5, 7):
+            for x in (2.0**e, -2.0**e, -1.5 * 2.0**e):
+                points += [(x, 10.0), (10.0, x)]
+        self.assertMatchesGeohash(points)
+
+    def test_edges(self):
+        self.assertMatchesGeohash([(-90.0, -180.0), (45.0, 180.0), (10.0, 540.0),
+                                   (10.0, -541.0), (math.nextafter(90.0, 0), 1.0)])
+        for lat, lon in ((90.1, 0.0), (-90.1, 0.0), (0.0, math.inf)):
+            self.assertRaises(ValueError, not3words._latlon_to_bits45, lat, lon)
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_float32(self):
+        rng = numpy.random.default_rng(3)
+        points = rng.uniform([-90, -180], [90, 180], (2000, 2)).astype(numpy.float32)
+        for lat, lon in points:
+            self.assertEqual(not3words._latlon_to_bits45(lat, lon),
+                             geohash_bits45(float(lat), float(lon)), (lat, lon))
+
+
+class ThreeWordsManyTest(unittest.TestCase):
+
+    def test_matches_three_words(self):
+        rng = random.Random(4)
+        lats = [rng.uniform(-90, 90) for _ in range(200)]
+        lons = [rng.uniform(-180, 180) for _ in range(200)]
+        self.assertEqual(not3words.three_words_many(lats, lons),
+                         [not3words.three_words(p) for p in zip(lats, lons)])
+
+    def test_length_mismatch(self):
+        self.assertRaises(ValueError, not3words.three_words_many, [1.0, 2.0, 3.0], [4.0])
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_float32_arrays(self):
+        rng = numpy.random.default_rng(5)
+        lats = rng.uniform(-90, 90, 500).astype(numpy.float32)
+        lons = rng.uniform(-180, 180, 500).astype(numpy.float32)
+        self.assertEqual(not3words.three_words_many(lats, lons),
+                         [not3words.three_words((float(a), float(o))) for a, o in zip(lats, lons)])
+
+
+if __name__ == '__main__':
+    unittest.main()